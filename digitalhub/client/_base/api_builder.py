@@ -2,6 +2,18 @@ from __future__ import annotations
 
 from abc import abstractmethod
 
+from digitalhub.entities._commons.enums import BackendOperations
+
+COLLECTION_OPERATIONS = (
+    BackendOperations.CREATE.value,
+    BackendOperations.LIST.value,
+)
+ITEM_OPERATIONS = (
+    BackendOperations.READ.value,
+    BackendOperations.UPDATE.value,
+    BackendOperations.DELETE.value,
+)
+
 
 class ClientApiBuilder:
     """
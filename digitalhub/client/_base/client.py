@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import typing
 from abc import abstractmethod
+from collections.abc import Iterator
 from typing import Any
 
 if typing.TYPE_CHECKING:
@@ -56,6 +57,12 @@ class Client:
         List objects method.
         """
 
+    @abstractmethod
+    def iter_objects(self, api: str, **kwargs) -> Iterator[dict]:
+        """
+        Iterate objects method.
+        """
+
     @abstractmethod
     def list_first_object(self, api: str, **kwargs) -> dict:
         """
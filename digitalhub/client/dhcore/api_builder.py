@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from digitalhub.client._base.api_builder import ClientApiBuilder
+from digitalhub.client._base.api_builder import COLLECTION_OPERATIONS, ITEM_OPERATIONS, ClientApiBuilder
 from digitalhub.entities._commons.enums import ApiCategories, BackendOperations
 from digitalhub.utils.exceptions import BackendError
 
@@ -52,16 +52,9 @@ class ClientDHCoreApiBuilder(ClientApiBuilder):
             API formatted.
         """
         entity_type = kwargs["entity_type"] + "s"
-        if operation in (
-            BackendOperations.CREATE.value,
-            BackendOperations.LIST.value,
-        ):
+        if operation in COLLECTION_OPERATIONS:
             return f"{API_BASE}/{entity_type}"
-        elif operation in (
-            BackendOperations.READ.value,
-            BackendOperations.UPDATE.value,
-            BackendOperations.DELETE.value,
-        ):
+        elif operation in ITEM_OPERATIONS:
             return f"{API_BASE}/{entity_type}/{kwargs['entity_name']}"
         elif operation == BackendOperations.SHARE.value:
             return f"{API_BASE}/{entity_type}/{kwargs['entity_name']}/share"
@@ -73,16 +66,9 @@ class ClientDHCoreApiBuilder(ClientApiBuilder):
         """
         entity_type = kwargs["entity_type"] + "s"
         project = kwargs["project"]
-        if operation in (
-            BackendOperations.CREATE.value,
-            BackendOperations.LIST.value,
-        ):
+        if operation in COLLECTION_OPERATIONS:
             return f"{API_CONTEXT}/{project}/{entity_type}"
-        elif operation in (
-            BackendOperations.READ.value,
-            BackendOperations.UPDATE.value,
-            BackendOperations.DELETE.value,
-        ):
+        elif operation in ITEM_OPERATIONS:
             return f"{API_CONTEXT}/{project}/{entity_type}/{kwargs['entity_id']}"
         elif operation == BackendOperations.LOGS.value:
             return f"{API_CONTEXT}/{project}/{entity_type}/{kwargs['entity_id']}/logs"
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import typing
+from collections.abc import Iterator
 from typing import Any
 
-from requests import request
+from requests import Session
 from requests.exceptions import JSONDecodeError
 
 from digitalhub.client._base.client import Client
@@ -50,6 +51,9 @@ class ClientDHCore(Client):
         self._configurator = ClientDHCoreConfigurator()
         self._configurator.configure(config)
 
+        # HTTP session, reuses pooled connections across calls
+        self._session = Session()
+
     ##############################
     # CRUD methods
     ##############################
@@ -157,6 +161,24 @@ class ClientDHCore(Client):
         list[dict]
             Response objects.
         """
+        return list(self.iter_objects(api, **kwargs))
+
+    def iter_objects(self, api: str, **kwargs) -> Iterator[dict]:
+        """
+        Iterate over objects from DHCore, fetching one page at a time.
+
+        Parameters
+        ----------
+        api : str
+            List API.
+        **kwargs : dict
+            Keyword arguments to pass to the request.
+
+        Yields
+        ------
+        dict
+            Response object.
+        """
         if kwargs is None:
             kwargs = {}
 
@@ -167,18 +189,15 @@ class ClientDHCore(Client):
         if "page" not in kwargs["params"]:
             kwargs["params"]["page"] = start_page
 
-        objects = []
         while True:
             resp = self._prepare_call("GET", api, **kwargs)
             contents = resp["content"]
             total_pages = resp["totalPages"]
             if not contents or kwargs["params"]["page"] >= total_pages:
                 break
-            objects.extend(contents)
+            yield from contents
             kwargs["params"]["page"] += 1
 
-        return objects
-
     def list_first_object(self, api: str, **kwargs) -> dict:
         """
         List first objects.
@@ -196,8 +215,8 @@ class ClientDHCore(Client):
             The list of objects.
         """
         try:
-            return self.list_objects(api, **kwargs)[0]
-        except IndexError:
+            return next(self.iter_objects(api, **kwargs))
+        except StopIteration:
             raise BackendError("No object found.")
 
     def search_objects(self, api: str, **kwargs) -> list[dict]:
@@ -297,7 +316,7 @@ class ClientDHCore(Client):
             Response object.
         """
         # Call the API
-        response = request(call_type, url, timeout=60, **kwargs)
+        response = self._session.request(call_type, url, timeout=60, **kwargs)
 
         # Evaluate DHCore API version
         self._configurator.check_core_version(response)
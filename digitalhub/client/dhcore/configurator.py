@@ -29,6 +29,10 @@ class ClientDHCoreConfigurator:
     Configurator object used to configure the client.
     """
 
+    def __init__(self) -> None:
+        # Last backend API level checked
+        self._api_level: int | None = None
+
     ##############################
     # Configuration methods
     ##############################
@@ -98,10 +102,13 @@ class ClientDHCoreConfigurator:
         """
         if "X-Api-Level" in response.headers:
             core_api_level = int(response.headers["X-Api-Level"])
+            if core_api_level == self._api_level:
+                return
             if not (MIN_API_LEVEL <= core_api_level <= MAX_API_LEVEL):
                 raise ClientError("Backend API level not supported.")
             if LIB_VERSION < core_api_level:
                 warn("Backend API level is higher than library version. You should consider updating the library.")
+            self._api_level = core_api_level
 
     def build_url(self, api: str) -> str:
         """
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from digitalhub.client._base.api_builder import ClientApiBuilder
+from digitalhub.client._base.api_builder import COLLECTION_OPERATIONS, ITEM_OPERATIONS, ClientApiBuilder
 from digitalhub.client.local.enums import LocalClientVar
 from digitalhub.entities._commons.enums import ApiCategories, BackendOperations
 from digitalhub.utils.exceptions import BackendError
@@ -53,16 +53,9 @@ class ClientLocalApiBuilder(ClientApiBuilder):
             API formatted.
         """
         entity_type = kwargs["entity_type"] + "s"
-        if operation in (
-            BackendOperations.CREATE.value,
-            BackendOperations.LIST.value,
-        ):
+        if operation in COLLECTION_OPERATIONS:
             return f"{API_BASE}/{entity_type}"
-        elif operation in (
-            BackendOperations.READ.value,
-            BackendOperations.UPDATE.value,
-            BackendOperations.DELETE.value,
-        ):
+        elif operation in ITEM_OPERATIONS:
             return f"{API_BASE}/{entity_type}/{kwargs['entity_name']}"
         raise BackendError(f"API for operation '{operation}' for entity type '{entity_type}' not implemented in Local.")
 
@@ -72,16 +65,9 @@ class ClientLocalApiBuilder(ClientApiBuilder):
         """
         entity_type = kwargs["entity_type"] + "s"
         project = kwargs["project"]
-        if operation in (
-            BackendOperations.CREATE.value,
-            BackendOperations.LIST.value,
-        ):
+        if operation in COLLECTION_OPERATIONS:
             return f"{API_CONTEXT}/{project}/{entity_type}"
-        elif operation in (
-            BackendOperations.READ.value,
-            BackendOperations.UPDATE.value,
-            BackendOperations.DELETE.value,
-        ):
+        elif operation in ITEM_OPERATIONS:
             return f"{API_CONTEXT}/{project}/{entity_type}/{kwargs['entity_id']}"
         elif operation in (
             BackendOperations.LOGS.value,
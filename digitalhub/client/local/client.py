@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from copy import deepcopy
 from datetime import datetime, timezone
 from typing import Any
@@ -342,6 +343,24 @@ class ClientLocal(Client):
 
         return listed_objects
 
+    def iter_objects(self, api: str, **kwargs) -> Iterator[dict]:
+        """
+        Iterate objects.
+
+        Parameters
+        ----------
+        api : str
+            List API.
+        **kwargs : dict
+            Keyword arguments parsed from request.
+
+        Yields
+        ------
+        dict
+            Listed object.
+        """
+        yield from self.list_objects(api, **kwargs)
+
     def list_first_object(self, api: str, **kwargs) -> dict:
         """
         List first objects.
@@ -16,6 +16,10 @@ if typing.TYPE_CHECKING:
 
 
 class ContextEntity(Entity):
+    # Extra status data fetched after a read (e.g. "files", "metrics").
+    # Need to be expanded in subclasses.
+    SUPPORTS: frozenset[str] = frozenset()
+
     def __init__(
         self,
         project: str,
@@ -19,6 +19,8 @@ class MaterialEntity(VersionedEntity):
     as file(s).
     """
 
+    SUPPORTS = frozenset({"files"})
+
     def __init__(
         self,
         project: str,
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import typing
+from collections.abc import Iterator
 from typing import Any
 
 from digitalhub.client.api import get_client
@@ -30,6 +31,8 @@ class OperationsProcessor:
     Operations can be CRUD, search, list, etc.
     """
 
+    __slots__ = ()
+
     ##############################
     # CRUD base entity
     ##############################
@@ -220,10 +223,11 @@ class OperationsProcessor:
         obj["local"] = client.is_local()
         ent: ProjectEntity = build_entity_from_dict(obj)
 
+        ent_dict = ent.to_dict()
         try:
-            self._update_base_entity(ent._client, ent.ENTITY_TYPE, ent.name, ent.to_dict())
+            self._update_base_entity(ent._client, ent.ENTITY_TYPE, ent.name, ent_dict)
         except EntityNotExistsError:
-            self._create_base_entity(ent._client, ent.ENTITY_TYPE, ent.to_dict())
+            self._create_base_entity(ent._client, ent.ENTITY_TYPE, ent_dict)
 
         # Load related entities
         ent._load_entities(obj)
@@ -611,8 +615,8 @@ class OperationsProcessor:
         if context.is_running:
             obj.add_relationship(Relationship.PRODUCEDBY.value, context.get_run_ctx())
 
-        new_obj: MaterialEntity = self._create_context_entity(context, obj.ENTITY_TYPE, obj.to_dict())
-        new_obj = build_entity_from_dict(new_obj)
+        new_obj_dict = self._create_context_entity(context, obj.ENTITY_TYPE, obj.to_dict())
+        new_obj: MaterialEntity = build_entity_from_dict(new_obj_dict)
         new_obj.upload(source)
         return new_obj
 
@@ -808,10 +812,7 @@ class OperationsProcessor:
         if isinstance(dict_obj, list):
             exec_dict = dict_obj[0]
             exec_dict["status"] = {}
-            tsk_dicts = []
-            for i in dict_obj[1:]:
-                i["status"] = {}
-                tsk_dicts.append(i)
+            tsk_dicts = [{**i, "status": {}} for i in dict_obj[1:]]
         else:
             exec_dict = dict_obj
             tsk_dicts = []
@@ -847,10 +848,11 @@ class OperationsProcessor:
         dict_obj: dict = read_yaml(file)
         context = self._get_context(dict_obj["project"])
         obj: ContextEntity = build_entity_from_dict(dict_obj)
+        obj_dict = obj.to_dict()
         try:
-            self._update_context_entity(context, obj.ENTITY_TYPE, obj.id, obj.to_dict())
+            self._update_context_entity(context, obj.ENTITY_TYPE, obj.id, obj_dict)
         except EntityNotExistsError:
-            self._create_context_entity(context, obj.ENTITY_TYPE, obj.to_dict())
+            self._create_context_entity(context, obj.ENTITY_TYPE, obj_dict)
         return obj
 
     def load_executable_entity(
@@ -881,23 +883,24 @@ class OperationsProcessor:
         context = self._get_context(exec_dict["project"])
         obj: ExecutableEntity = build_entity_from_dict(exec_dict)
 
+        obj_dict = obj.to_dict()
         try:
-            self._update_context_entity(context, obj.ENTITY_TYPE, obj.id, obj.to_dict())
+            self._update_context_entity(context, obj.ENTITY_TYPE, obj.id, obj_dict)
         except EntityNotExistsError:
-            self._create_context_entity(context, obj.ENTITY_TYPE, obj.to_dict())
+            self._create_context_entity(context, obj.ENTITY_TYPE, obj_dict)
         obj.import_tasks(tsk_dicts)
         return obj
 
-    def _read_context_entity_versions(
+    def _iter_context_entity_versions(
         self,
         context: Context,
         identifier: str,
         entity_type: str | None = None,
         project: str | None = None,
         **kwargs,
-    ) -> list[dict]:
+    ) -> Iterator[dict]:
         """
-        Get all versions object from backend.
+        Iterate all versions object from backend, one page at a time.
 
         Parameters
         ----------
@@ -914,8 +917,8 @@ class OperationsProcessor:
 
         Returns
         -------
-        list[dict]
-            Object instances.
+        Iterator[dict]
+            Iterator over objects.
         """
         if not identifier.startswith("store://"):
             if project is None or entity_type is None:
@@ -934,17 +937,18 @@ class OperationsProcessor:
             project=context.name,
             entity_type=entity_type,
         )
-        return context.client.list_objects(api, **kwargs)
+        return context.client.iter_objects(api, **kwargs)
 
-    def read_context_entity_versions(
+    def iter_context_entity_versions(
         self,
         identifier: str,
         entity_type: str | None = None,
         project: str | None = None,
         **kwargs,
-    ) -> list[ContextEntity]:
+    ) -> Iterator[ContextEntity]:
         """
-        Read object versions from backend.
+        Iterate over object versions from backend.
+        Pages are fetched only when the previous one is consumed.
 
         Parameters
         ----------
@@ -957,34 +961,66 @@ class OperationsProcessor:
         **kwargs : dict
             Parameters to pass to the API call.
 
-        Returns
-        -------
-        list[ContextEntity]
-            List of object instances.
+        Yields
+        ------
+        ContextEntity
+            Object instance.
         """
         context = self._get_context_from_identifier(identifier, project)
-        objs = self._read_context_entity_versions(
+        objs = self._iter_context_entity_versions(
             context,
             identifier,
             entity_type=entity_type,
             project=project,
             **kwargs,
         )
-        objects = []
         for o in objs:
             entity: ContextEntity = build_entity_from_dict(o)
-            entity = self._post_process_get(entity)
-            objects.append(entity)
-        return objects
+            yield self._post_process_get(entity)
 
-    def _list_context_entities(
+    def read_context_entity_versions(
+        self,
+        identifier: str,
+        entity_type: str | None = None,
+        project: str | None = None,
+        **kwargs,
+    ) -> list[ContextEntity]:
+        """
+        Read object versions from backend.
+
+        Parameters
+        ----------
+        identifier : str
+            Entity key (store://...) or entity name.
+        entity_type : str
+            Entity type.
+        project : str
+            Project name.
+        **kwargs : dict
+            Parameters to pass to the API call.
+
+        Returns
+        -------
+        list[ContextEntity]
+            List of object instances.
+        """
+        return list(
+            self.iter_context_entity_versions(
+                identifier,
+                entity_type=entity_type,
+                project=project,
+                **kwargs,
+            )
+        )
+
+    def _iter_context_entities(
         self,
         context: Context,
         entity_type: str,
         **kwargs,
-    ) -> list[dict]:
+    ) -> Iterator[dict]:
         """
-        List objects from backend.
+        Iterate objects from backend, one page at a time.
 
         Parameters
         ----------
@@ -997,8 +1033,8 @@ class OperationsProcessor:
 
         Returns
         -------
-        list[dict]
-            List of objects.
+        Iterator[dict]
+            Iterator over objects.
         """
         api = context.client.build_api(
             ApiCategories.CONTEXT.value,
@@ -1006,7 +1042,36 @@ class OperationsProcessor:
             project=context.name,
             entity_type=entity_type,
         )
-        return context.client.list_objects(api, **kwargs)
+        return context.client.iter_objects(api, **kwargs)
+
+    def iter_context_entities(
+        self,
+        project: str,
+        entity_type: str,
+        **kwargs,
+    ) -> Iterator[ContextEntity]:
+        """
+        Iterate over all latest version objects from backend.
+        Pages are fetched only when the previous one is consumed.
+
+        Parameters
+        ----------
+        project : str
+            Project name.
+        entity_type : str
+            Entity type.
+        **kwargs : dict
+            Parameters to pass to the API call.
+
+        Yields
+        ------
+        ContextEntity
+            Object instance.
+        """
+        context = self._get_context(project)
+        for o in self._iter_context_entities(context, entity_type, **kwargs):
+            entity: ContextEntity = build_entity_from_dict(o)
+            yield self._post_process_get(entity)
 
     def list_context_entities(
         self,
@@ -1031,14 +1096,7 @@ class OperationsProcessor:
         list[ContextEntity]
             List of object instances.
         """
-        context = self._get_context(project)
-        objs = self._list_context_entities(context, entity_type, **kwargs)
-        objects = []
-        for o in objs:
-            entity: ContextEntity = build_entity_from_dict(o)
-            entity = self._post_process_get(entity)
-            objects.append(entity)
-        return objects
+        return list(self.iter_context_entities(project, entity_type, **kwargs))
 
     def _update_context_entity(
         self,
@@ -1167,6 +1225,8 @@ class OperationsProcessor:
                 "If `delete_all_versions` is False, `entity_id` must be provided, either as an argument or in key `identifier`."
             )
 
+        # Deleting all versions is a single DELETE on the collection
+        # endpoint filtered by name, the backend removes every version.
         if delete_all_versions:
             api = context.client.build_api(
                 ApiCategories.CONTEXT.value,
@@ -1238,9 +1298,9 @@ class OperationsProcessor:
         ContextEntity
             Post processed entity.
         """
-        if hasattr(entity.status, "metrics"):
+        if "metrics" in entity.SUPPORTS:
             entity._get_metrics()
-        if hasattr(entity.status, "files"):
+        if "files" in entity.SUPPORTS:
             entity._get_files_info()
         return entity
 
@@ -1642,7 +1702,7 @@ class OperationsProcessor:
 
     def _search(
         self,
-        project: str,
+        context: Context,
         **kwargs,
     ) -> dict:
         """
@@ -1650,8 +1710,8 @@ class OperationsProcessor:
 
         Parameters
         ----------
-        project : str
-            Project name.
+        context : Context
+            Context instance.
         **kwargs : dict
             Parameters to pass to the API call.
 
@@ -1660,7 +1720,6 @@ class OperationsProcessor:
         dict
             Response from backend.
         """
-        context = self._get_context(project)
         api = context.client.build_api(
             ApiCategories.CONTEXT.value,
             BackendOperations.SEARCH.value,
@@ -1759,9 +1818,7 @@ class OperationsProcessor:
         # Add filters
         kwargs["params"]["fq"] = fq
 
-        objs = self._search(context, **kwargs)
-        return objs
-        return [build_entity_from_dict(obj) for obj in objs]
+        return self._search(context, **kwargs)
 
     ##############################
     # Helpers
@@ -1782,10 +1839,7 @@ class OperationsProcessor:
         dict
             Parameters with initialized params.
         """
-        if not kwargs:
-            kwargs = {}
-        if "params" not in kwargs:
-            kwargs["params"] = {}
+        kwargs.setdefault("params", {})
         return kwargs
 
     def _get_context_from_identifier(
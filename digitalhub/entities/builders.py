@@ -1,63 +1,48 @@
 from __future__ import annotations
 
-from digitalhub.entities.artifact.artifact.builder import ArtifactArtifactBuilder
-from digitalhub.entities.dataitem.dataitem.builder import DataitemDataitemBuilder
-from digitalhub.entities.dataitem.table.builder import DataitemTableBuilder
-from digitalhub.entities.model.mlflow.builder import ModelModelBuilder
-from digitalhub.entities.project._base.builder import ProjectProjectBuilder
-from digitalhub.entities.secret._base.builder import SecretSecretBuilder
+from digitalhub.entities._commons.enums import EntityKinds
 
+# Builders are referenced by import path and resolved by the
+# factory on first use, so importing this module stays cheap.
 entity_builders = (
-    (ProjectProjectBuilder.ENTITY_KIND, ProjectProjectBuilder),
-    (SecretSecretBuilder.ENTITY_KIND, SecretSecretBuilder),
-    (ArtifactArtifactBuilder.ENTITY_KIND, ArtifactArtifactBuilder),
-    (DataitemDataitemBuilder.ENTITY_KIND, DataitemDataitemBuilder),
-    (DataitemTableBuilder.ENTITY_KIND, DataitemTableBuilder),
-    (ModelModelBuilder.ENTITY_KIND, ModelModelBuilder),
+    (
+        EntityKinds.PROJECT_PROJECT.value,
+        "digitalhub.entities.project._base.builder:ProjectProjectBuilder",
+    ),
+    (
+        EntityKinds.SECRET_SECRET.value,
+        "digitalhub.entities.secret._base.builder:SecretSecretBuilder",
+    ),
+    (
+        EntityKinds.ARTIFACT_ARTIFACT.value,
+        "digitalhub.entities.artifact.artifact.builder:ArtifactArtifactBuilder",
+    ),
+    (
+        EntityKinds.DATAITEM_DATAITEM.value,
+        "digitalhub.entities.dataitem.dataitem.builder:DataitemDataitemBuilder",
+    ),
+    (
+        EntityKinds.DATAITEM_TABLE.value,
+        "digitalhub.entities.dataitem.table.builder:DataitemTableBuilder",
+    ),
+    (
+        EntityKinds.DATAITEM_ICEBERG.value,
+        "digitalhub.entities.dataitem.iceberg.builder:DataitemIcebergBuilder",
+    ),
+    (
+        EntityKinds.MODEL_MLFLOW.value,
+        "digitalhub.entities.model.mlflow.builder:ModelModelBuilder",
+    ),
+    (
+        EntityKinds.MODEL_MODEL.value,
+        "digitalhub.entities.model.model.builder:ModelMlflowBuilder",
+    ),
+    (
+        EntityKinds.MODEL_SKLEARN.value,
+        "digitalhub.entities.model.sklearn.builder:ModelSklearnBuilder",
+    ),
+    (
+        EntityKinds.MODEL_HUGGINGFACE.value,
+        "digitalhub.entities.model.huggingface.builder:ModelHuggingfaceBuilder",
+    ),
 )
-
-##############################
-#  Potential uninstalled entities
-##############################
-
-
-try:
-    from digitalhub.entities.dataitem.iceberg.builder import DataitemIcebergBuilder
-
-    entity_builders = (
-        *entity_builders,
-        (DataitemIcebergBuilder.ENTITY_KIND, DataitemIcebergBuilder),
-    )
-except ImportError:
-    ...
-
-
-try:
-    from digitalhub.entities.model.model.builder import ModelMlflowBuilder
-
-    entity_builders = (
-        *entity_builders,
-        (ModelMlflowBuilder.ENTITY_KIND, ModelMlflowBuilder),
-    )
-except ImportError:
-    ...
-
-try:
-    from digitalhub.entities.model.sklearn.builder import ModelSklearnBuilder
-
-    entity_builders = (
-        *entity_builders,
-        (ModelSklearnBuilder.ENTITY_KIND, ModelSklearnBuilder),
-    )
-except ImportError:
-    ...
-
-try:
-    from digitalhub.entities.model.huggingface.builder import ModelHuggingfaceBuilder
-
-    entity_builders = (
-        *entity_builders,
-        (ModelHuggingfaceBuilder.ENTITY_KIND, ModelHuggingfaceBuilder),
-    )
-except ImportError:
-    ...
@@ -7,6 +7,7 @@ from typing import Any
 
 from digitalhub.entities.dataitem._base.entity import Dataitem
 from digitalhub.stores.api import get_store
+from digitalhub.utils.exceptions import EntityError
 from digitalhub.utils.uri_utils import has_local_scheme
 
 if typing.TYPE_CHECKING:
@@ -78,9 +79,11 @@ class DataitemTable(Dataitem):
                 tmp_dir.mkdir(parents=True, exist_ok=True)
                 data_path = self.download(destination=str(tmp_dir), overwrite=True)
 
-            if Path(data_path).is_dir():
-                files = [str(i) for i in Path(data_path).rglob("*") if i.is_file()]
-                checker = files[0]
+            # Only the first file is needed to infer the extension
+            if file_format is None and Path(data_path).is_dir():
+                checker = next((str(i) for i in Path(data_path).rglob("*") if i.is_file()), None)
+                if checker is None:
+                    raise EntityError(f"No files found in {data_path}.")
             else:
                 checker = data_path
 
@@ -15,6 +15,8 @@ if typing.TYPE_CHECKING:
     from digitalhub.entities.dataitem._base.entity import Dataitem
 
 
+ENTITY_TYPE = EntityTypes.DATAITEM.value
+TABLE_KIND = EntityKinds.DATAITEM_TABLE.value
 DEFAULT_EXTENSION = "parquet"
 
 
@@ -44,7 +46,7 @@ def eval_source(
         eval_local_source(source)
         return source
 
-    if kind == EntityKinds.DATAITEM_TABLE.value:
+    if kind == TABLE_KIND:
         ctx = get_context(project)
         pth = ctx.root / f"{slugify_string(name)}.{DEFAULT_EXTENSION}"
         reader = get_reader_by_object(data)
@@ -89,13 +91,13 @@ def process_kwargs(
         Kwargs updated.
     """
     if data is not None:
-        if kind == EntityKinds.DATAITEM_TABLE.value:
+        if kind == TABLE_KIND:
             reader = get_reader_by_object(data)
             kwargs["schema"] = reader.get_schema(data)
     if path is None:
         uuid = build_uuid()
         kwargs["uuid"] = uuid
-        kwargs["path"] = build_log_path_from_source(project, EntityTypes.DATAITEM.value, name, uuid, source)
+        kwargs["path"] = build_log_path_from_source(project, ENTITY_TYPE, name, uuid, source)
     else:
         kwargs["path"] = path
     return kwargs
@@ -133,8 +135,12 @@ def post_process(obj: Dataitem, data: Any) -> Dataitem:
     Dataitem
         The object.
     """
-    if obj.kind == EntityKinds.DATAITEM_TABLE.value:
+    if obj.kind == TABLE_KIND:
         reader = get_reader_by_object(data)
-        obj.status.preview = reader.get_preview(data)
+        preview = reader.get_preview(data)
+        # Empty (or too big) previews leave nothing to save
+        if not preview and not obj.status.preview:
+            return obj
+        obj.status.preview = preview
         obj.save(update=True)
     return obj
@@ -19,6 +19,7 @@ class Model(MaterialEntity):
     """
 
     ENTITY_TYPE = EntityTypes.MODEL.value
+    SUPPORTS = frozenset({"files", "metrics"})
 
     def __init__(
         self,
@@ -3,8 +3,6 @@ from __future__ import annotations
 import typing
 from urllib.parse import urlparse
 
-import mlflow
-
 from digitalhub.entities.model.mlflow.models import Dataset, Signature
 
 if typing.TYPE_CHECKING:
@@ -25,6 +23,8 @@ def get_mlflow_run(run_id: str) -> Run:
     Run
         The extracted run.
     """
+    import mlflow
+
     return mlflow.MlflowClient().get_run(run_id)
 
 
@@ -42,6 +42,7 @@ def from_mlflow_run(run_id: str) -> dict:
     dict
         The extracted spec.
     """
+    import mlflow
 
     # Get MLFlow run
     run = get_mlflow_run(run_id)
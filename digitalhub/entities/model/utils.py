@@ -6,6 +6,8 @@ from digitalhub.entities._base.entity._constructors.uuid import build_uuid
 from digitalhub.entities._base.material.utils import build_log_path_from_source, eval_local_source
 from digitalhub.entities._commons.enums import EntityTypes
 
+ENTITY_TYPE = EntityTypes.MODEL.value
+
 
 def eval_source(
     source: str | list[str] | None = None,
@@ -56,7 +58,7 @@ def process_kwargs(
     if path is None:
         uuid = build_uuid()
         kwargs["uuid"] = uuid
-        kwargs["path"] = build_log_path_from_source(project, EntityTypes.MODEL.value, name, uuid, source)
+        kwargs["path"] = build_log_path_from_source(project, ENTITY_TYPE, name, uuid, source)
     else:
         kwargs["path"] = path
     return kwargs
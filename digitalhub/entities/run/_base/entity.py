@@ -30,6 +30,7 @@ class Run(UnversionedEntity):
     """
 
     ENTITY_TYPE = EntityTypes.RUN.value
+    SUPPORTS = frozenset({"metrics"})
 
     def __init__(
         self,
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import importlib
 import typing
 
 from digitalhub.utils.exceptions import BuilderError
@@ -21,19 +22,21 @@ class Factory:
     """
 
     def __init__(self):
-        self._entity_builders: dict[str, EntityBuilder | RuntimeEntityBuilder] = {}
+        self._entity_builders: dict[str, EntityBuilder | RuntimeEntityBuilder | str] = {}
         self._runtime_builders: dict[str, RuntimeBuilder] = {}
 
-    def add_entity_builder(self, name: str, builder: EntityBuilder | RuntimeEntityBuilder) -> None:
+    def add_entity_builder(self, name: str, builder: EntityBuilder | RuntimeEntityBuilder | str) -> None:
         """
-        Add a builder to the factory.
+        Add a builder to the factory. The builder can be given as a
+        class or as a "module:Class" import path, in which case it is
+        imported and instantiated on first use.
 
         Parameters
         ----------
         name : str
             Builder name.
-        builder : EntityBuilder
-            Builder object.
+        builder : EntityBuilder | RuntimeEntityBuilder | str
+            Builder class or import path.
 
         Returns
         -------
@@ -41,7 +44,7 @@ class Factory:
         """
         if name in self._entity_builders:
             raise BuilderError(f"Builder {name} already exists.")
-        self._entity_builders[name] = builder()
+        self._entity_builders[name] = builder if isinstance(builder, str) else builder()
 
     def add_runtime_builder(self, name: str, builder: RuntimeBuilder) -> None:
         """
@@ -78,7 +81,7 @@ class Factory:
         Entity
             Entity object.
         """
-        return self._entity_builders[kind_to_build_from].build(**kwargs)
+        return self._get_entity_builder(kind_to_build_from).build(**kwargs)
 
     def build_entity_from_dict(self, kind_to_build_from: str, obj: dict) -> Entity:
         """
@@ -96,7 +99,7 @@ class Factory:
         Entity
             Entity object.
         """
-        return self._entity_builders[kind_to_build_from].from_dict(obj)
+        return self._get_entity_builder(kind_to_build_from).from_dict(obj)
 
     def build_spec(self, kind_to_build_from: str, **kwargs) -> Spec:
         """
@@ -112,7 +115,7 @@ class Factory:
         Spec
             Spec object.
         """
-        return self._entity_builders[kind_to_build_from].build_spec(**kwargs)
+        return self._get_entity_builder(kind_to_build_from).build_spec(**kwargs)
 
     def build_metadata(self, kind_to_build_from: str, **kwargs) -> Metadata:
         """
@@ -128,7 +131,7 @@ class Factory:
         Metadata
             Metadata object.
         """
-        return self._entity_builders[kind_to_build_from].build_metadata(**kwargs)
+        return self._get_entity_builder(kind_to_build_from).build_metadata(**kwargs)
 
     def build_status(self, kind_to_build_from: str, **kwargs) -> Status:
         """
@@ -144,7 +147,7 @@ class Factory:
         Status
             Status object.
         """
-        return self._entity_builders[kind_to_build_from].build_status(**kwargs)
+        return self._get_entity_builder(kind_to_build_from).build_status(**kwargs)
 
     def build_runtime(self, kind_to_build_from: str, project: str) -> Runtime:
         """
@@ -178,7 +181,7 @@ class Factory:
         str
             Entity type.
         """
-        return self._entity_builders[kind].get_entity_type()
+        return self._get_entity_builder(kind).get_entity_type()
 
     def get_executable_kind(self, kind: str) -> str:
         """
@@ -194,7 +197,7 @@ class Factory:
         str
             Executable kind.
         """
-        return self._entity_builders[kind].get_executable_kind()
+        return self._get_entity_builder(kind).get_executable_kind()
 
     def get_action_from_task_kind(self, kind: str, task_kind: str) -> str:
         """
@@ -212,7 +215,7 @@ class Factory:
         str
             Action.
         """
-        return self._entity_builders[kind].get_action_from_task_kind(task_kind)
+        return self._get_entity_builder(kind).get_action_from_task_kind(task_kind)
 
     def get_task_kind_from_action(self, kind: str, action: str) -> list[str]:
         """
@@ -230,7 +233,7 @@ class Factory:
         list[str]
             Task kinds.
         """
-        return self._entity_builders[kind].get_task_kind_from_action(action)
+        return self._get_entity_builder(kind).get_task_kind_from_action(action)
 
     def get_run_kind(self, kind: str) -> str:
         """
@@ -246,7 +249,7 @@ class Factory:
         str
             Run kind.
         """
-        return self._entity_builders[kind].get_run_kind()
+        return self._get_entity_builder(kind).get_run_kind()
 
     def get_all_kinds(self, kind: str) -> list[str]:
         """
@@ -262,7 +265,28 @@ class Factory:
         list[str]
             All kinds.
         """
-        return self._entity_builders[kind].get_all_kinds()
+        return self._get_entity_builder(kind).get_all_kinds()
+
+    def _get_entity_builder(self, kind: str) -> EntityBuilder | RuntimeEntityBuilder:
+        """
+        Get entity builder, resolving lazy import paths on first access.
+
+        Parameters
+        ----------
+        kind : str
+            Kind.
+
+        Returns
+        -------
+        EntityBuilder | RuntimeEntityBuilder
+            Builder object.
+        """
+        builder = self._entity_builders[kind]
+        if isinstance(builder, str):
+            module, cls = builder.split(":")
+            builder = getattr(importlib.import_module(module), cls)()
+            self._entity_builders[kind] = builder
+        return builder
 
 
 factory = Factory()
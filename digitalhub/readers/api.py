@@ -10,6 +10,11 @@ if typing.TYPE_CHECKING:
     from digitalhub.readers._base.reader import DataframeReader
 
 
+# Readers are stateless, so they are built once and reused
+_readers_by_engine: dict[str, DataframeReader] = {}
+_readers_by_type: dict[type, DataframeReader] = {}
+
+
 def get_reader_by_engine(engine: str | None = None) -> DataframeReader:
     """
     Get Dataframe reader.
@@ -26,12 +31,16 @@ def get_reader_by_engine(engine: str | None = None) -> DataframeReader:
     """
     if engine is None:
         engine = factory.get_default()
-    try:
-        return factory.build(engine=engine)
-    except KeyError:
-        engines = factory.list_supported_engines()
-        msg = f"Unsupported dataframe engine: '{engine}'. Supported engines: {engines}"
-        raise ReaderError(msg)
+    reader = _readers_by_engine.get(engine)
+    if reader is None:
+        try:
+            reader = factory.build(engine=engine)
+        except KeyError:
+            engines = factory.list_supported_engines()
+            msg = f"Unsupported dataframe engine: '{engine}'. Supported engines: {engines}"
+            raise ReaderError(msg)
+        _readers_by_engine[engine] = reader
+    return reader
 
 
 def get_reader_by_object(obj: Any) -> DataframeReader:
@@ -48,13 +57,18 @@ def get_reader_by_object(obj: Any) -> DataframeReader:
     DataframeReader
         Reader object.
     """
-    try:
-        obj_name = f"{obj.__class__.__module__}.{obj.__class__.__name__}"
-        return factory.build(dataframe=obj_name)
-    except KeyError:
-        types = factory.list_supported_dataframes()
-        msg = f"Unsupported dataframe type: '{obj}'. Supported types: {types}"
-        raise ReaderError(msg)
+    obj_type = obj.__class__
+    reader = _readers_by_type.get(obj_type)
+    if reader is None:
+        try:
+            obj_name = f"{obj_type.__module__}.{obj_type.__name__}"
+            reader = factory.build(dataframe=obj_name)
+        except KeyError:
+            types = factory.list_supported_dataframes()
+            msg = f"Unsupported dataframe type: '{obj}'. Supported types: {types}"
+            raise ReaderError(msg)
+        _readers_by_type[obj_type] = reader
+    return reader
 
 
 def get_supported_engines() -> list[str]:
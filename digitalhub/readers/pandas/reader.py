@@ -12,7 +12,7 @@ from digitalhub.entities.dataitem.table.utils import check_preview_size, finaliz
 from digitalhub.readers._base.reader import DataframeReader
 from digitalhub.readers.pandas.enums import Extensions
 from digitalhub.utils.exceptions import ReaderError
-from digitalhub.utils.generic_utils import CustomJsonEncoder
+from digitalhub.utils.generic_utils import CustomJsonEncoder, dump_json
 
 
 class DataframeReaderPandas(DataframeReader):
@@ -264,4 +264,4 @@ def _serialize_deserialize_preview(preview: dict) -> dict:
     dict
         The serialized preview.
     """
-    return json.loads(json.dumps(preview, cls=PandasJsonEncoder))
+    return json.loads(dump_json(preview, cls=PandasJsonEncoder))
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from io import BytesIO
 from pathlib import Path
 from typing import Any, Type
@@ -7,6 +8,8 @@ from urllib.parse import urlparse
 
 import boto3
 import botocore.client  # pylint: disable=unused-import
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from digitalhub.readers.api import get_reader_by_object
@@ -19,6 +22,14 @@ from digitalhub.utils.file_utils import get_file_info_from_s3, get_file_mime_typ
 # Type aliases
 S3Client = Type["botocore.client.S3"]
 
+# Maximum number of concurrent file uploads
+MAX_UPLOAD_WORKERS = 8
+
+# Transfer threads per file during concurrent uploads. The client
+# connection pool is sized so that all the workers fit in it.
+MAX_UPLOAD_CONCURRENCY = 4
+MAX_POOL_CONNECTIONS = MAX_UPLOAD_WORKERS * MAX_UPLOAD_CONCURRENCY
+
 
 class S3Store(Store):
     """
@@ -298,11 +309,8 @@ class S3Store(Store):
             keys.append(f"{dst}{i}")
 
         # Upload files
-        paths = []
-        for f, k in zip(files, keys):
-            self._upload_file(f, k, client, bucket)
-            paths.append((k, str(f.relative_to(src_pth))))
-        return paths
+        self._upload_files([str(f) for f in files], keys, client, bucket)
+        return [(k, str(f.relative_to(src_pth))) for f, k in zip(files, keys)]
 
     def _upload_file_list(
         self,
@@ -338,11 +346,8 @@ class S3Store(Store):
             raise StoreError("Keys must be unique (Select files with different names, otherwise upload a directory).")
 
         # Upload files
-        paths = []
-        for f, k in zip(files, keys):
-            self._upload_file(f, k, client, bucket)
-            paths.append((k, Path(f).name))
-        return paths
+        self._upload_files(files, keys, client, bucket)
+        return [(k, Path(f).name) for f, k in zip(files, keys)]
 
     def _upload_single_file(
         self,
@@ -378,12 +383,54 @@ class S3Store(Store):
         name = Path(self._get_key(dst)).name
         return [(dst, name)]
 
+    def _upload_files(
+        self,
+        src: list[str],
+        keys: list[str],
+        client: S3Client,
+        bucket: str,
+    ) -> None:
+        """
+        Upload a list of files to S3 based storage concurrently.
+
+        Parameters
+        ----------
+        src : list[str]
+            The source paths of the files on local filesystem.
+        keys : list[str]
+            The keys of the files on S3 based storage.
+        client : S3Client
+            The S3 client object.
+        bucket : str
+            The name of the S3 bucket.
+
+        Returns
+        -------
+        None
+        """
+        if len(src) <= 1:
+            for f, k in zip(src, keys):
+                self._upload_file(f, k, client, bucket)
+            return
+
+        config = TransferConfig(max_concurrency=MAX_UPLOAD_CONCURRENCY)
+        with ThreadPoolExecutor(max_workers=min(MAX_UPLOAD_WORKERS, len(src))) as executor:
+            futures = [executor.submit(self._upload_file, f, k, client, bucket, config) for f, k in zip(src, keys)]
+            try:
+                for future in as_completed(futures):
+                    future.result()
+            except Exception:
+                # Do not start the queued uploads after a failure
+                executor.shutdown(wait=True, cancel_futures=True)
+                raise
+
     @staticmethod
     def _upload_file(
         src: str,
         key: str,
         client: S3Client,
         bucket: str,
+        config: TransferConfig | None = None,
     ) -> None:
         """
         Upload a file to S3 based storage. The function checks if the
@@ -399,6 +446,8 @@ class S3Store(Store):
             The S3 client object.
         bucket : str
             The name of the S3 bucket.
+        config : TransferConfig
+            The transfer configuration. If None, boto3 defaults are used.
 
         Returns
         -------
@@ -408,7 +457,7 @@ class S3Store(Store):
         mime_type = get_file_mime_type(src)
         if mime_type is not None:
             extra_args["ContentType"] = mime_type
-        client.upload_file(Filename=src, Bucket=bucket, Key=key, ExtraArgs=extra_args)
+        client.upload_file(Filename=src, Bucket=bucket, Key=key, ExtraArgs=extra_args, Config=config)
 
     @staticmethod
     def _upload_fileobject(
@@ -497,6 +546,7 @@ class S3Store(Store):
             Returns a client object that interacts with the S3 storage service.
         """
         cfg = self._configurator.get_s3_creds()
+        cfg["config"] = cfg["config"].merge(Config(max_pool_connections=MAX_POOL_CONNECTIONS))
         return boto3.client("s3", **cfg)
 
     def _check_factory(self, root: str) -> tuple[S3Client, str]:
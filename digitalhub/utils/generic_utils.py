@@ -15,6 +15,11 @@ from slugify import slugify
 
 from digitalhub.utils.io_utils import read_text
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def get_timestamp() -> str:
     """
@@ -141,6 +146,8 @@ class CustomJsonEncoder(json.JSONEncoder):
         """
         if isinstance(obj, (int, str, float, list, dict)):
             return obj
+        elif isinstance(obj, Enum):
+            return obj.value
         elif isinstance(obj, (np.integer, np.int64)):
             return int(obj)
         elif isinstance(obj, (np.floating, np.float64)):
@@ -152,7 +159,32 @@ class CustomJsonEncoder(json.JSONEncoder):
         return str(obj)
 
 
-def dump_json(struct: Any) -> str:
+def _replace_non_finite(obj: Any) -> Any:
+    """
+    Replace non-finite floats (NaN, inf) with None, as orjson does.
+
+    Parameters
+    ----------
+    obj : Any
+        The object to sanitize.
+
+    Returns
+    -------
+    Any
+        The sanitized object.
+    """
+    if isinstance(obj, (float, np.floating)):
+        return float(obj) if np.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {k: _replace_non_finite(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_replace_non_finite(v) for v in obj]
+    if isinstance(obj, np.ndarray):
+        return _replace_non_finite(obj.tolist())
+    return obj
+
+
+def dump_json(struct: Any, cls: type[CustomJsonEncoder] = CustomJsonEncoder) -> str:
     """
     Convert a dict to json.
 
@@ -160,13 +192,35 @@ def dump_json(struct: Any) -> str:
     ----------
     struct : dict
         The dict to convert.
+    cls : type[CustomJsonEncoder]
+        Encoder used for objects json does not support natively.
 
     Returns
     -------
     str
         The json string.
     """
-    return json.dumps(struct, cls=CustomJsonEncoder).encode("utf-8")
+    # Prefer orjson if installed, fall back to the stdlib encoder
+    # for payloads it refuses (e.g. integers over 64 bit).
+    # Both paths produce the same output: compact separators, utf-8,
+    # non-finite floats as null, enums as their value, datetimes,
+    # dataclasses and numpy values through the encoder default.
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                struct,
+                default=cls().default,
+                option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_NON_STR_KEYS,
+            )
+        except TypeError:
+            pass
+    kwargs = {"cls": cls, "separators": (",", ":"), "ensure_ascii": False, "allow_nan": False}
+    try:
+        dumped = json.dumps(struct, **kwargs)
+    except ValueError:
+        # Non-finite floats are rare, sanitize only when json refuses them
+        dumped = json.dumps(_replace_non_finite(struct), **kwargs)
+    return dumped.encode("utf-8")
 
 
 def slugify_string(filename: str) -> str:
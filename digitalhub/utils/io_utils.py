@@ -4,6 +4,12 @@ from pathlib import Path
 
 import yaml
 
+# Use the libyaml backed loader if available
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 ##############################
 # Writers
 ##############################
@@ -55,7 +61,7 @@ def write_text(filepath: Path, text: str) -> None:
 ##############################
 
 
-class NoDatesSafeLoader(yaml.SafeLoader):
+class NoDatesSafeLoader(SafeLoader):
     """
     Loader implementation to exclude implicit resolvers.
 
@@ -106,15 +112,14 @@ def read_yaml(filepath: str | Path) -> dict | list[dict]:
     dict | list[dict]
         The yaml file content.
     """
-    try:
-        with open(filepath, "r", encoding="utf-8") as in_file:
-            data = yaml.load(in_file, Loader=NoDatesSafeLoader)
+    # Parse all documents in a single pass
+    with open(filepath, "r", encoding="utf-8") as in_file:
+        data = list(yaml.load_all(in_file, Loader=NoDatesSafeLoader))
 
     # If yaml contains multiple documents
-    except yaml.composer.ComposerError:
-        with open(filepath, "r", encoding="utf-8") as in_file:
-            data = list(yaml.load_all(in_file, Loader=NoDatesSafeLoader))
-    return data
+    if len(data) > 1:
+        return data
+    return data[0] if data else None
 
 
 def read_text(filepath: str | Path) -> str:
@@ -76,6 +76,17 @@ class SchemeCategory(Enum):
     GIT = "git"
 
 
+# Scheme to category mapping, built once at import time
+_SCHEME_CATEGORIES = {
+    **{scheme: SchemeCategory.LOCAL.value for scheme in list_enum(LocalSchemes)},
+    **{scheme: SchemeCategory.REMOTE.value for scheme in list_enum(RemoteSchemes)},
+    **{scheme: SchemeCategory.S3.value for scheme in list_enum(S3Schemes)},
+    **{scheme: SchemeCategory.SQL.value for scheme in list_enum(SqlSchemes)},
+    **{scheme: SchemeCategory.GIT.value for scheme in list_enum(GitSchemes)},
+}
+_INVALID_LOCAL_SCHEMES = frozenset(list_enum(InvalidLocalSchemes))
+
+
 def map_uri_scheme(uri: str) -> str:
     """
     Map an URI scheme to a common scheme.
@@ -95,20 +106,14 @@ def map_uri_scheme(uri: str) -> str:
     ValueError
         If the scheme is unknown.
     """
-    scheme = urlparse(uri).scheme
-    if scheme in list_enum(LocalSchemes):
-        return SchemeCategory.LOCAL.value
-    if scheme in list_enum(InvalidLocalSchemes):
+    # Plain paths carry no scheme, skip the parse
+    scheme = urlparse(uri).scheme if ":" in uri else ""
+    if scheme in _INVALID_LOCAL_SCHEMES:
         raise ValueError("For local URI, do not use any scheme.")
-    if scheme in list_enum(RemoteSchemes):
-        return SchemeCategory.REMOTE.value
-    if scheme in list_enum(S3Schemes):
-        return SchemeCategory.S3.value
-    if scheme in list_enum(SqlSchemes):
-        return SchemeCategory.SQL.value
-    if scheme in list_enum(GitSchemes):
-        return SchemeCategory.GIT.value
-    raise ValueError(f"Unknown scheme '{scheme}'!")
+    try:
+        return _SCHEME_CATEGORIES[scheme]
+    except KeyError:
+        raise ValueError(f"Unknown scheme '{scheme}'!")
 
 
 def has_local_scheme(uri: str) -> bool:
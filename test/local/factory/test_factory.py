@@ -0,0 +1,23 @@
+"""
+Unit tests for the entity builders registry
+"""
+
+import pytest
+
+import digitalhub  # noqa: F401  # registers the builders
+from digitalhub.entities.builders import entity_builders
+from digitalhub.factory.factory import factory
+
+KINDS = [kind for kind, _ in entity_builders]
+
+
+@pytest.mark.parametrize("kind", KINDS)
+def test_core_builders_registered(kind):
+    assert kind in factory._entity_builders
+
+
+@pytest.mark.parametrize("kind", sorted(factory._entity_builders))
+def test_entity_builders_resolve(kind):
+    builder = factory._get_entity_builder(kind)
+    assert not isinstance(builder, str)
+    assert builder.ENTITY_KIND == kind
@@ -0,0 +1,66 @@
+"""
+Unit tests for the S3 store uploads
+"""
+
+import boto3
+import pytest
+from boto3.exceptions import S3UploadFailedError
+from moto import mock_aws
+
+from digitalhub.stores.s3.store import S3Store
+
+BUCKET = "bucket"
+N_FILES = 20
+
+
+class TestS3StoreUpload:
+    @pytest.fixture
+    def client(self):
+        with mock_aws():
+            client = boto3.client("s3", region_name="us-east-1")
+            client.create_bucket(Bucket=BUCKET)
+            yield client
+
+    @pytest.fixture
+    def store(self, monkeypatch):
+        monkeypatch.setenv("S3_ENDPOINT_URL", "http://localhost:9000")
+        monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+        monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+        monkeypatch.setenv("S3_BUCKET_NAME", BUCKET)
+        return S3Store()
+
+    @pytest.fixture
+    def files(self, tmp_path):
+        src = tmp_path / "src"
+        (src / "sub").mkdir(parents=True)
+        paths = []
+        for i in range(N_FILES):
+            pth = src / ("sub" if i % 2 else "") / f"file{i}.txt"
+            pth.write_text(f"content {i}")
+            paths.append(pth)
+        return src, paths
+
+    def test_upload_dir(self, store, client, files):
+        src, _ = files
+        uploaded = store._upload_dir(str(src), "dst/", client, BUCKET)
+
+        # Returned in the order the directory is walked
+        expected = [i.relative_to(src) for i in src.rglob("*") if i.is_file()]
+        assert uploaded == [(f"dst/{i}", str(i)) for i in expected]
+        for key, pth in uploaded:
+            body = client.get_object(Bucket=BUCKET, Key=key)["Body"].read()
+            assert body == (src / pth).read_bytes()
+
+    def test_upload_file_list(self, store, client, files):
+        _, paths = files
+        uploaded = store._upload_file_list([str(i) for i in paths], "dst/", client, BUCKET)
+
+        assert uploaded == [(f"dst/{i.name}", i.name) for i in paths]
+        for (key, _), pth in zip(uploaded, paths):
+            body = client.get_object(Bucket=BUCKET, Key=key)["Body"].read()
+            assert body == pth.read_bytes()
+
+    def test_upload_error(self, store, client, files):
+        _, paths = files
+        with pytest.raises(S3UploadFailedError):
+            store._upload_file_list([str(i) for i in paths], "dst/", client, "missing-bucket")
@@ -0,0 +1,73 @@
+"""
+Unit tests for json serialization
+"""
+
+import datetime
+import json
+from dataclasses import dataclass
+from enum import Enum
+
+import numpy as np
+import pytest
+
+from digitalhub.utils import generic_utils
+from digitalhub.utils.generic_utils import dump_json
+
+
+class Color(Enum):
+    RED = "red"
+
+
+@dataclass
+class Point:
+    x: int = 1
+
+
+CASES = [
+    {"enum": Color.RED, "enums": [Color.RED, Color.RED]},
+    {"floats": [1.5, float("nan"), float("inf"), -float("inf")]},
+    {"nested": [{"a": [float("nan")]}, (1, 2.0)]},
+    {
+        "np": [
+            np.int64(3),
+            np.float64(0.1),
+            np.float32(0.5),
+            np.float32("nan"),
+            np.float64("inf"),
+            np.array([1.0, np.nan]),
+            np.array([[1, 2]]),
+        ]
+    },
+    {
+        "datetime": datetime.datetime(2024, 1, 2, 3, 4, 5, 6),
+        "tz": datetime.datetime(2024, 1, 2, tzinfo=datetime.timezone.utc),
+        "date": datetime.date(2024, 1, 1),
+        "time": datetime.time(1, 2),
+    },
+    {"big": 2**70, "small": -(2**70)},
+    {"text": 'àé \n\x01"\\', "none": None, "bool": True},
+    {1: "int key", 2.5: "float key", None: "none key"},
+    {"dataclass": Point(), "bytes": b"ab", "set": {1}},
+]
+
+
+@pytest.mark.parametrize("struct", CASES)
+def test_dump_json_parity(struct, monkeypatch):
+    pytest.importorskip("orjson")
+    fast = dump_json(struct)
+    monkeypatch.setattr(generic_utils, "orjson", None)
+    assert dump_json(struct) == fast
+
+
+@pytest.mark.parametrize("struct", CASES)
+def test_dump_json_stdlib(struct, monkeypatch):
+    monkeypatch.setattr(generic_utils, "orjson", None)
+    dumped = dump_json(struct)
+    assert b"NaN" not in dumped and b"Infinity" not in dumped
+    json.loads(dumped)
+
+
+def test_dump_json_values(monkeypatch):
+    monkeypatch.setattr(generic_utils, "orjson", None)
+    struct = {"enum": Color.RED, "nan": float("nan"), "np": np.float32("inf")}
+    assert json.loads(dump_json(struct)) == {"enum": "red", "nan": None, "np": None}